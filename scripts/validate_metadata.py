@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""Validate SKILL.md metadata for Claude Code skills.
+
+Checks the YAML frontmatter (name, description), file length, and file
+structure of a skill directory against Anthropic's skill authoring
+guidelines. Usage:
+
+    python scripts/validate_metadata.py skills/impression [--json]
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+# Translation table for the name charset check: valid name bytes map to
+# themselves, everything else to NUL, so one C-level translate pass plus a
+# NUL membership test replaces a per-character Python loop (see
+# SkillValidator.NAME_PATTERN for the spec).
+_NAME_TABLE = bytes(
+    i if chr(i) in 'abcdefghijklmnopqrstuvwxyz0123456789-' else 0
+    for i in range(256))
+
+# Plain scalars PyYAML would type-infer (YAML 1.1 booleans, null, numbers,
+# timestamps). The fast frontmatter scanner only produces strings, so it
+# punts on these rather than disagreeing with yaml.safe_load.
+_TYPED_SCALARS = frozenset(
+    ('true', 'false', 'yes', 'no', 'on', 'off', 'null', '~'))
+
+
+def _is_typed_scalar(value):
+    return value.lower() in _TYPED_SCALARS or value[0] in '+-.0123456789'
+
+
+class SkillValidator:
+    """Validates a skill directory's SKILL.md metadata and structure."""
+
+    # Validator instances are short-lived and created per skill; slots skip
+    # the per-instance __dict__ allocation, which adds up in batch runs.
+    __slots__ = ('skill_path', 'skill_md_path', 'results',
+                 '_skill_md_head', '_skill_md_bytes')
+
+    # Kept as the spec reference for valid names; the hot path in
+    # _validate_name_field uses an equivalent string-method check instead.
+    NAME_PATTERN = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+    MAX_NAME_LENGTH = 64
+    MAX_DESCRIPTION_LENGTH = 1024
+    MAX_SKILL_MD_LINES = 500
+    # Frontmatter lives in the first few hundred bytes; read this much up
+    # front and only fall back to a full read if the closing --- is missing.
+    FRONTMATTER_READ_SIZE = 8192
+    RESERVED_WORDS = ['anthropic', 'claude']
+    RESERVED_RE = re.compile('|'.join(RESERVED_WORDS), re.IGNORECASE)
+
+    # Precompiled at class-body time: compiled.search() skips the re module's
+    # internal pattern cache lookup on every call, which matters when
+    # validating many skills in a batch. Both voice categories live in one
+    # alternation with named groups so a single pass over the description
+    # classifies every match.
+    VOICE_RE = re.compile(
+        r'(?P<fp>\bI\s+(?:can|will|help|provide|offer)|\bmy\s|\bme\s)'
+        r'|(?P<sp>\byou\s+can|\byour\s|\blet\s+me\s+help\s+you)',
+        re.IGNORECASE)
+
+    # "When to use" cues; one case-insensitive pass instead of lowering the
+    # whole description and running a substring scan per keyword.
+    WHEN_RE = re.compile(r'\b(?:use\s+when|when(?:ever)?|for|triggers?)\b',
+                         re.IGNORECASE)
+
+    # Bytes pattern with re.ASCII keeps \w on the compact byte-class path
+    # instead of the Unicode property tables; paths are ASCII anyway.
+    WINDOWS_PATH_RE = re.compile(rb'[\w/]+\\[\w/\\]+', re.ASCII)
+
+    def __init__(self, skill_path):
+        # absolute() is string-only; the path is just displayed, so the
+        # lstat chain resolve() does for symlinks buys nothing here.
+        self.skill_path = Path(skill_path).absolute()
+        self.skill_md_path = self.skill_path / 'SKILL.md'
+        self.results = {
+            'skill': str(self.skill_path),
+            'valid': True,
+            'errors': [],
+            'warnings': [],
+            'checks': [],
+        }
+
+    def validate(self):
+        """Run all checks and return the results dict."""
+        if not self.skill_md_path.exists():
+            self._add_error('SKILL.md not found in skill directory')
+            return self.results
+
+        # Read just enough for the frontmatter check; the full file is only
+        # loaded (once, lazily) if a later check needs it.
+        try:
+            with open(self.skill_md_path, 'rb') as f:
+                head = f.read(self.FRONTMATTER_READ_SIZE)
+                whole_file = len(head) < self.FRONTMATTER_READ_SIZE
+                if not whole_file and len(head.split(b'---', 2)) < 3:
+                    head += f.read()
+                    whole_file = True
+        except OSError as e:
+            self._add_error(f'Could not read SKILL.md: {e}')
+            return self.results
+        self._skill_md_head = head
+        self._skill_md_bytes = head if whole_file else None
+
+        self._check_yaml_frontmatter()
+        self._check_skill_md_length()
+        self._check_file_structure()
+        return self.results
+
+    def _load_full(self):
+        """Return the full SKILL.md bytes, reading them on first use."""
+        if self._skill_md_bytes is None:
+            self._skill_md_bytes = self.skill_md_path.read_bytes()
+        return self._skill_md_bytes
+
+    # ------------------------------------------------------------------
+    # Checks
+    # ------------------------------------------------------------------
+
+    def _check_yaml_frontmatter(self):
+        head = self._skill_md_head
+
+        if not head.startswith(b'---'):
+            self._add_error('SKILL.md must start with YAML frontmatter (---)')
+            return
+
+        parts = head.split(b'---', 2)
+        if len(parts) < 3:
+            self._add_error('YAML frontmatter is not closed with ---')
+            return
+
+        try:
+            yaml_content = parts[1].decode('utf-8')
+        except UnicodeDecodeError as e:
+            self._add_error(f'Frontmatter is not valid UTF-8: {e}')
+            return
+        metadata = self._fast_frontmatter_parse(yaml_content)
+        if metadata is None:
+            # Imported only when the fast scanner punts, so --help and
+            # simple frontmatter never pay the PyYAML import; sys.modules
+            # caches it after the first fallback.
+            try:
+                import yaml
+            except ImportError:
+                self._add_error(
+                    'Frontmatter needs a full YAML parse but PyYAML is not '
+                    'installed (pip install pyyaml)')
+                return
+            try:
+                from yaml import CSafeLoader as loader
+            except ImportError:
+                from yaml import SafeLoader as loader
+                self._add_warning(
+                    'Using pure-Python YAML loader; install libyaml for '
+                    'faster parsing')
+            try:
+                metadata = yaml.load(yaml_content, Loader=loader)
+            except yaml.YAMLError as e:
+                self._add_error(f'Invalid YAML frontmatter: {e}')
+                return
+
+        if not isinstance(metadata, dict):
+            self._add_error('YAML frontmatter must be a mapping')
+            return
+
+        self._add_check('frontmatter', True, 'YAML frontmatter parsed')
+        self._validate_name_field(metadata.get('name'))
+        self._validate_description_field(metadata.get('description'))
+
+    @staticmethod
+    def _fast_frontmatter_parse(yaml_content):
+        """Parse simple frontmatter without PyYAML's full pipeline.
+
+        Skill frontmatter is a handful of scalar keys, so a one-pass line
+        scanner covers the common case: ``key: value`` pairs, comments,
+        literal block scalars (``key: |``), and one level of nesting for
+        blocks like ``metadata:``. Returns None on anything fancier (flow
+        collections, anchors, tags, folded scalars) so the caller can fall
+        back to yaml.safe_load.
+        """
+        result = {}
+        lines = yaml_content.split('\n')
+        i, n = 0, len(lines)
+        while i < n:
+            line = lines[i]
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                i += 1
+                continue
+            if line[0] in ' \t':
+                return None
+            key, sep, value = line.partition(':')
+            key = key.strip()
+            if not sep or not key or any(c in key for c in ' \t\'"{}[]&*!|>'):
+                return None
+            value = value.strip()
+            if value.startswith('#'):
+                value = ''
+            else:
+                comment_at = value.find(' #')
+                if comment_at != -1:
+                    value = value[:comment_at].rstrip()
+            i += 1
+            if value in ('|', '|-'):
+                block, indent = [], None
+                while i < n:
+                    raw = lines[i]
+                    if raw.strip() and raw[0] not in ' \t':
+                        break
+                    # Tabs are illegal YAML indentation; let PyYAML report it.
+                    if '\t' in raw[:len(raw) - len(raw.lstrip())]:
+                        return None
+                    if raw.strip() and indent is None:
+                        indent = len(raw) - len(raw.lstrip())
+                    block.append(raw[indent:] if indent else raw.lstrip())
+                    i += 1
+                text = '\n'.join(block).rstrip('\n')
+                # An empty block is '' either way, matching safe_load.
+                result[key] = text if value == '|-' else (
+                    text + '\n' if text else '')
+            elif value == '':
+                sub = {}
+                while i < n:
+                    raw = lines[i]
+                    if not raw.strip():
+                        i += 1
+                        continue
+                    if raw[0] not in ' \t':
+                        break
+                    if '\t' in raw[:len(raw) - len(raw.lstrip())]:
+                        return None
+                    sub_key, sub_sep, sub_value = raw.strip().partition(':')
+                    sub_key = sub_key.strip()
+                    sub_value = sub_value.strip()
+                    # Same comment handling as the top level.
+                    if sub_value.startswith('#'):
+                        sub_value = ''
+                    else:
+                        comment_at = sub_value.find(' #')
+                        if comment_at != -1:
+                            sub_value = sub_value[:comment_at].rstrip()
+                    if (not sub_sep or not sub_key or not sub_value
+                            or sub_value[:1] in '\'"{}[]&*!|>'
+                            or _is_typed_scalar(sub_value)):
+                        return None
+                    sub[sub_key] = sub_value
+                    i += 1
+                # A key with no value and no indented block is None in YAML.
+                result[key] = sub or None
+            elif value[0] in '{[&*!>':
+                return None
+            elif value[0] in '\'"':
+                # Punt on escapes: backslashes in double quotes, doubled
+                # quotes in single quotes, or any embedded quote char.
+                if (len(value) < 2 or value[-1] != value[0]
+                        or '\\' in value or value[0] in value[1:-1]):
+                    return None
+                result[key] = value[1:-1]
+            elif _is_typed_scalar(value):
+                return None
+            else:
+                result[key] = value
+        return result
+
+    def _validate_name_field(self, name):
+        if not name:
+            self._add_error("Missing required field 'name'")
+            return
+        if not isinstance(name, str):
+            self._add_error("Field 'name' must be a string")
+            return
+
+        if len(name) > self.MAX_NAME_LENGTH:
+            self._add_error(
+                f"Name exceeds {self.MAX_NAME_LENGTH} characters ({len(name)})")
+
+        name_bytes = name.encode('ascii', 'replace')
+        if (name[0] == '-' or name[-1] == '-' or '--' in name
+                or b'\x00' in name_bytes.translate(_NAME_TABLE)):
+            self._add_error(
+                'Name must be lowercase letters, digits, and hyphens '
+                f"(got '{name}')")
+
+        reserved_found = sorted({m.group(0).lower()
+                                 for m in self.RESERVED_RE.finditer(name)})
+        if reserved_found:
+            self._add_error(
+                f"Name contains reserved word(s): {', '.join(reserved_found)}")
+
+        if not self.results['errors']:
+            self._add_check('name', True, f"Name '{name}' is valid")
+
+    def _validate_description_field(self, description):
+        if not description:
+            self._add_error("Missing required field 'description'")
+            return
+        if not isinstance(description, str):
+            self._add_error("Field 'description' must be a string")
+            return
+
+        if len(description) > self.MAX_DESCRIPTION_LENGTH:
+            self._add_error(
+                f'Description exceeds {self.MAX_DESCRIPTION_LENGTH} '
+                f'characters ({len(description)})')
+
+        matched_groups = {m.lastgroup
+                          for m in self.VOICE_RE.finditer(description)}
+        voice_issues = []
+        if 'fp' in matched_groups:
+            voice_issues.append('first person')
+        if 'sp' in matched_groups:
+            voice_issues.append('second person')
+        if voice_issues:
+            self._add_warning(
+                'Description uses ' + ' and '.join(voice_issues) +
+                '; prefer third person ("Extracts...", "Generates...")')
+
+        has_when = bool(self.WHEN_RE.search(description))
+        if not has_when:
+            self._add_warning(
+                'Description should say when to use the skill '
+                '(e.g. "Use when...")')
+
+        self._add_check('description', True, 'Description checked')
+
+    def _check_skill_md_length(self):
+        # bytes.count runs the newline scan in C without materializing a
+        # line list; add one for a final line with no trailing newline.
+        data = self._load_full()
+        line_count = data.count(b'\n') + (
+            1 if data and not data.endswith(b'\n') else 0)
+
+        if line_count > self.MAX_SKILL_MD_LINES:
+            self._add_warning(
+                f'SKILL.md is {line_count} lines; consider moving detail '
+                f'into references/ (recommended max '
+                f'{self.MAX_SKILL_MD_LINES})')
+        else:
+            self._add_check('length', True, f'SKILL.md is {line_count} lines')
+
+    def _check_file_structure(self):
+        # No check consumes the file count, so enumerating the whole skill
+        # tree was pure stat traffic; only SKILL.md is inspected here.
+        content = self._load_full()
+
+        # Membership test stops at the first backslash (memchr) instead of
+        # counting them all; the count was never reported anyway.
+        if b'\\' in content:
+            windows_paths = self.WINDOWS_PATH_RE.findall(content)[:3]
+            if windows_paths:
+                self._add_warning(
+                    'SKILL.md contains Windows-style paths: '
+                    + ', '.join(p.decode('utf-8', 'replace')
+                                for p in windows_paths)
+                    + ' (use forward slashes)')
+        self._add_check('file_structure', True, 'SKILL.md paths checked')
+
+    # ------------------------------------------------------------------
+    # Result helpers
+    # ------------------------------------------------------------------
+
+    def _add_check(self, name, passed, message):
+        self.results['checks'].append(
+            {'name': name, 'passed': passed, 'message': message})
+
+    def _add_error(self, message):
+        self.results['valid'] = False
+        self.results['errors'].append(message)
+
+    def _add_warning(self, message):
+        self.results['warnings'].append(message)
+
+
+def validate_many(paths, parallel=False):
+    """Validate several skill directories; returns one results dict each.
+
+    Amortizes interpreter startup and the PyYAML import across a whole CI
+    matrix instead of paying them once per skill. Validation is bound by
+    stat calls and small file reads, so threads are enough for --parallel.
+    """
+    if parallel and len(paths) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor() as pool:
+            return list(pool.map(
+                lambda path: SkillValidator(path).validate(), paths))
+    return [SkillValidator(path).validate() for path in paths]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Validate SKILL.md metadata for Claude Code skills')
+    parser.add_argument('skill_paths', nargs='*',
+                        help='Skill directories to validate')
+    parser.add_argument('--batch', metavar='FILE',
+                        help='File listing skill directories, one per line')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Validate skills concurrently')
+    parser.add_argument('--json', action='store_true',
+                        help='Emit results as JSON')
+    args = parser.parse_args()
+
+    paths = list(args.skill_paths)
+    if args.batch:
+        with open(args.batch, encoding='utf-8') as f:
+            paths.extend(line.strip() for line in f if line.strip())
+    if not paths:
+        parser.error('no skill directories given')
+
+    all_results = validate_many(paths, parallel=args.parallel)
+
+    if args.json:
+        # Shape follows the invocation, not the result count: a single
+        # positional path keeps the original bare-dict output, while
+        # multi-path and --batch runs always emit an array so CI consumers
+        # get a stable schema.
+        single = len(args.skill_paths) == 1 and not args.batch
+        payload = all_results[0] if single else all_results
+        print(_dumps(payload))
+    else:
+        for results in all_results:
+            status = 'PASS' if results['valid'] else 'FAIL'
+            print(f"{status}: {results['skill']}")
+            for check in results['checks']:
+                print(f"  ok  {check['message']}")
+            for warning in results['warnings']:
+                print(f"  warn  {warning}")
+            for error in results['errors']:
+                print(f"  ERROR  {error}")
+
+    sys.exit(0 if all(r['valid'] for r in all_results) else 1)
+
+
+if __name__ == '__main__':
+    main()
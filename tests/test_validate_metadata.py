@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Tests for scripts/validate_metadata.py.
+
+The JS test-runner covers the Node scripts; this module covers the Python
+validator with plain unittest:
+
+    python tests/test_validate_metadata.py
+"""
+
+import importlib.util
+import unittest
+from pathlib import Path
+
+import yaml
+
+_SCRIPT = Path(__file__).resolve().parent.parent / 'scripts' / 'validate_metadata.py'
+_spec = importlib.util.spec_from_file_location('validate_metadata', _SCRIPT)
+validate_metadata = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(validate_metadata)
+
+SkillValidator = validate_metadata.SkillValidator
+
+
+class FastFrontmatterParseTest(unittest.TestCase):
+    """_fast_frontmatter_parse must agree with yaml.safe_load or punt."""
+
+    def assert_matches_pyyaml(self, text):
+        self.assertEqual(SkillValidator._fast_frontmatter_parse(text),
+                         yaml.safe_load(text))
+
+    def assert_punts(self, text):
+        self.assertIsNone(SkillValidator._fast_frontmatter_parse(text))
+
+    def test_plain_scalars(self):
+        self.assert_matches_pyyaml('name: my-skill\ndescription: Does things\n')
+
+    def test_comments_and_blank_lines(self):
+        self.assert_matches_pyyaml(
+            '# header\nname: my-skill\n\ndescription: Does things  # inline\n')
+
+    def test_comment_directly_after_colon_is_empty_value(self):
+        # safe_load reads the value as None, not the comment text.
+        self.assert_matches_pyyaml('name: # todo set later\ndescription: x\n')
+        self.assert_matches_pyyaml('name:\ndescription: x\n')
+
+    def test_literal_block_scalar(self):
+        self.assert_matches_pyyaml(
+            'name: my-skill\ndescription: |\n  Line one.\n  Line two.\n')
+
+    def test_literal_block_scalar_strip(self):
+        self.assert_matches_pyyaml(
+            'name: my-skill\ndescription: |-\n  Line one.\n  Line two.\n')
+
+    def test_empty_literal_block_scalar(self):
+        # safe_load gives '' (falsy) for an empty block; '\n' from the fast
+        # path would flip a missing-description failure into a PASS.
+        self.assert_matches_pyyaml('name: my-skill\ndescription: |\n')
+        self.assert_matches_pyyaml('description: |\nname: my-skill\n')
+        self.assert_matches_pyyaml('name: my-skill\ndescription: |-\n')
+
+    def test_nested_metadata_block(self):
+        self.assert_matches_pyyaml(
+            'name: my-skill\nmetadata:\n  type: reference\n  author: me\n')
+
+    def test_nested_block_inline_comments(self):
+        self.assert_matches_pyyaml(
+            'metadata:\n  type: reference # inline\n  author: me\n')
+        # Comment-only sub-values punt rather than guessing.
+        self.assert_punts('metadata:\n  type: # todo\n')
+
+    def test_quoted_scalars(self):
+        self.assert_matches_pyyaml('name: "my-skill"\n')
+        self.assert_matches_pyyaml("name: 'my-skill'\n")
+
+    def test_bundled_skill_frontmatter(self):
+        skill_md = _SCRIPT.parent.parent / 'skills' / 'impression' / 'SKILL.md'
+        frontmatter = skill_md.read_text(encoding='utf-8').split('---', 2)[1]
+        self.assert_matches_pyyaml(frontmatter)
+
+    def test_punts_on_flow_collections(self):
+        self.assert_punts('metadata: {type: reference}\n')
+        self.assert_punts('tags: [a, b]\n')
+
+    def test_punts_on_anchors_and_tags(self):
+        self.assert_punts('name: &anchor my-skill\n')
+        self.assert_punts('version: !!str 1\n')
+
+    def test_punts_on_folded_scalar(self):
+        self.assert_punts('description: >\n  folded text\n')
+
+    def test_punts_on_tab_indentation(self):
+        # Tabs are illegal YAML indentation; PyYAML raises, so a fast-path
+        # PASS here would be a false negative.
+        for text in ('metadata:\n\tversion: 1\n',
+                     'description: |\n\ttabbed\n'):
+            self.assert_punts(text)
+            with self.assertRaises(yaml.YAMLError):
+                yaml.safe_load(text)
+
+    def test_punts_on_type_inferred_scalars(self):
+        # safe_load returns non-strings for these; the scanner must not
+        # silently stringify them.
+        for text in ('version: 2\n', 'enabled: true\n', 'extra: null\n',
+                     'date: 2024-01-01\n', 'metadata:\n  version: 1.5\n'):
+            self.assert_punts(text)
+
+    def test_punts_on_quote_escapes(self):
+        self.assert_punts("name: 'it''s'\n")
+        self.assert_punts('name: "a\\"b"\n')
+
+
+class ValidateNameFieldTest(unittest.TestCase):
+
+    def errors_for(self, name):
+        validator = SkillValidator('skills/impression')
+        validator._validate_name_field(name)
+        return validator.results['errors']
+
+    def test_valid_names(self):
+        for name in ('impression', 'a', 'a-b-c', 'a9-x2'):
+            self.assertEqual(self.errors_for(name), [], name)
+
+    def test_format_matches_name_pattern(self):
+        for name in ('impression', 'A', 'a_b', 'a b', '-a', 'a-', 'a--b',
+                     'café', 'a9-x'):
+            fast_ok = not any('lowercase letters' in e
+                              for e in self.errors_for(name))
+            self.assertEqual(fast_ok,
+                             bool(SkillValidator.NAME_PATTERN.match(name)),
+                             name)
+
+    def test_missing_name(self):
+        self.assertIn("Missing required field 'name'", self.errors_for(None))
+
+    def test_too_long(self):
+        errors = self.errors_for('a' * 65)
+        self.assertTrue(any('exceeds 64' in e for e in errors))
+
+    def test_reserved_words(self):
+        errors = self.errors_for('claude-helper')
+        self.assertTrue(any('reserved word' in e for e in errors))
+
+
+class ValidateDescriptionFieldTest(unittest.TestCase):
+
+    def results_for(self, description):
+        validator = SkillValidator('skills/impression')
+        validator._validate_description_field(description)
+        return validator.results
+
+    def test_valid_description(self):
+        results = self.results_for('Extracts design tokens. Use when asked.')
+        self.assertEqual(results['errors'], [])
+        self.assertEqual(results['warnings'], [])
+
+    def test_missing_description(self):
+        results = self.results_for(None)
+        self.assertIn("Missing required field 'description'",
+                      results['errors'])
+
+    def test_too_long(self):
+        results = self.results_for('x ' * 600)
+        self.assertTrue(any('exceeds 1024' in e for e in results['errors']))
+
+    def test_first_and_second_person_warnings(self):
+        results = self.results_for('I can help you with your designs')
+        self.assertTrue(any('first person and second person' in w
+                            for w in results['warnings']))
+
+    def test_missing_when_cue(self):
+        results = self.results_for('Extracts design tokens.')
+        self.assertTrue(any('when to use' in w for w in results['warnings']))
+
+    def test_plural_trigger_counts_as_when_cue(self):
+        results = self.results_for('Extracts design tokens. Triggers: x.')
+        self.assertFalse(any('when to use' in w for w in results['warnings']))
+
+
+if __name__ == '__main__':
+    unittest.main()